@@ -1,17 +1,43 @@
+import functools
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+_KEY_PREFIX = "INSTANTLY_API_KEY_"
+_KEY_PREFIX_LEN = len(_KEY_PREFIX)
+
+# Display-name fixups that .title() can't produce (keyed by uppercased name)
+_NAME_OVERRIDES = {
+    "CAMB AI": "CAMB.ai",
+    "KCAL": "Kcal",
+    "CAPQUEST": "CapQuest",
+    "INSURANCE MARKET": "Insurance Market",
+}
+
+@functools.lru_cache(maxsize=1)
+def _parse_instantly_keys():
+    """
+    Scans os.environ once for INSTANTLY_API_KEY_* variables.
+    Returns a tuple of (client_name, api_key) pairs with display-name
+    fixups applied. Cached so repeat callers skip the environ walk;
+    call _parse_instantly_keys.cache_clear() to force a re-scan.
+    """
+    pairs = []
+    for key in os.environ:
+        # Cheap single-char screen before the prefix compare: most inherited
+        # env vars don't start with 'I', so they never reach the slice.
+        if len(key) > _KEY_PREFIX_LEN and key[0] == 'I' and key[:_KEY_PREFIX_LEN] == _KEY_PREFIX:
+            val = os.environ[key]
+            # Extract client name from var name, e.g. INSTANTLY_API_KEY_LUXVANCE -> Luxvance
+            client_name = key[_KEY_PREFIX_LEN:].replace("_", " ").title()
+            client_name = _NAME_OVERRIDES.get(client_name.upper(), client_name)
+            pairs.append((client_name, val))
+    return tuple(pairs)
+
 def get_all_api_keys():
     """Retrieves all Instantly API keys from environment variables."""
-    keys = {}
-    for key, val in os.environ.items():
-        if key.startswith("INSTANTLY_API_KEY_"):
-            # Extract client name from var name, e.g. INSTANTLY_API_KEY_LUXVANCE -> LUXVANCE
-            client_name = key.replace("INSTANTLY_API_KEY_", "").replace("_", " ").title()
-            keys[client_name] = val
-            
+    keys = dict(_parse_instantly_keys())
     if not keys:
         raise ValueError("No environment variables starting with INSTANTLY_API_KEY_ found.")
     return keys
@@ -1,77 +1,207 @@
+import atexit
+import concurrent.futures
+import functools
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+from email.message import EmailMessage
 import os
 import datetime
+from dotenv import load_dotenv
 
-def send_email_report(subject, html_content, recipients):
+@functools.lru_cache(maxsize=1)
+def _smtp_config():
     """
-    Sends an HTML email report using SMTP credentials from environment variables.
-    
-    Args:
-        subject (str): The subject line of the email.
-        html_content (str): The HTML body of the email.
-        recipients (list): List of email addresses to send to.
+    Loads SMTP credentials from the environment exactly once.
+
+    Returns (server, port, email, password), already stripped. Cached so
+    every send after the first is a tuple unpack instead of four
+    os.getenv + strip calls; _smtp_config.cache_clear() forces a reload.
     """
-    # 1. Load Credentials
-    # 1. Load Credentials
+    load_dotenv()
+
     smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com").strip()
     smtp_port = int(os.getenv("SMTP_PORT", "587").strip())
-    
-    sender_email = os.getenv("SMTP_EMAIL", "")
-    sender_password = os.getenv("SMTP_PASSWORD", "")
-    
-    if sender_email: sender_email = sender_email.strip()
-    if sender_password: sender_password = sender_password.strip()
-    
-    if not sender_email or not sender_password:
-        print("⚠️ Skipping Email: SMTP_EMAIL or SMTP_PASSWORD not set in .env")
-        return
 
-    # 2. Create Message
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = f"Luxvance Bot <{sender_email}>"
-    msg["To"] = ", ".join(recipients)
+    sender_email = os.getenv("SMTP_EMAIL", "").strip()
+    sender_password = os.getenv("SMTP_PASSWORD", "").strip()
 
-    # 3. Attach HTML Body
-    # Add a simple style header for basic formatting
-    full_html = f"""
+    return smtp_server, smtp_port, sender_email, sender_password
+
+# Static wrapper around the report body, built once at import time instead of
+# re-assembling the CSS/header/footer f-string on every send. The footer
+# timestamp is the only dynamic part (%s).
+_HTML_HEAD = """
     <html>
     <head>
         <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; color: #333; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-            h2 {{ color: #0b333d; border-bottom: 2px solid #0b333d; padding-bottom: 10px; }}
-            .stat-box {{ background: #f4f6f8; padding: 15px; border-radius: 8px; margin-bottom: 20px; }}
-            .stat-row {{ display: flex; justify-content: space-between; margin-bottom: 8px; }}
-            .stat-label {{ color: #666; }}
-            .stat-value {{ font-weight: bold; color: #111; }}
-            .footer {{ font-size: 12px; color: #999; margin-top: 30px; text-align: center; }}
+            body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; color: #333; }
+            .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+            h2 { color: #0b333d; border-bottom: 2px solid #0b333d; padding-bottom: 10px; }
+            .stat-box { background: #f4f6f8; padding: 15px; border-radius: 8px; margin-bottom: 20px; }
+            .stat-row { display: flex; justify-content: space-between; margin-bottom: 8px; }
+            .stat-label { color: #666; }
+            .stat-value { font-weight: bold; color: #111; }
+            .footer { font-size: 12px; color: #999; margin-top: 30px; text-align: center; }
         </style>
     </head>
     <body>
         <div class="container">
-            {html_content}
-            
+            """
+
+_HTML_FOOT_FMT = """
+
             <div class="footer">
-                🚀 Sent by AntiGravity Automation • {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}
+                🚀 Sent by AntiGravity Automation • %s
             </div>
         </div>
     </body>
     </html>
     """
-    
-    msg.attach(MIMEText(full_html, "html"))
 
-    # 4. Send
-    try:
+class EmailReporter:
+    """
+    Sends HTML email reports over a persistent SMTP connection.
+
+    The connection is opened lazily on the first send and reused for
+    subsequent sends (one STARTTLS handshake + login per process instead
+    of one per email). A NOOP health check before each send transparently
+    reconnects if the server dropped the idle connection.
+    """
+
+    def __init__(self):
+        self._smtp = None
+
+    def _connect(self):
+        smtp_server, smtp_port, sender_email, sender_password = _smtp_config()
         print(f"📧 Connecting to SMTP ({smtp_server}:{smtp_port})...")
         server = smtplib.SMTP(smtp_server, smtp_port)
+        server.ehlo()
         server.starttls()
+        server.ehlo()
         server.login(sender_email, sender_password)
-        server.sendmail(sender_email, recipients, msg.as_string())
-        server.quit()
-        print(f"✅ Email sent to: {recipients}")
-    except Exception as e:
-        print(f"❌ Failed to send email: {e}")
+        self._smtp = server
+        return server
+
+    def _get_connection(self):
+        """Returns a live SMTP connection, reconnecting if needed."""
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self.close()
+        return self._connect()
+
+    def close(self):
+        """Closes the SMTP connection if open."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+    def send(self, subject, html_content, recipients):
+        """
+        Sends an HTML email report using SMTP credentials from environment variables.
+
+        All recipients ride one message envelope (one MAIL FROM / DATA
+        exchange for the whole list), so delivery cost doesn't scale with
+        the recipient count.
+
+        Args:
+            subject (str): The subject line of the email.
+            html_content (str): The HTML body of the email.
+            recipients (list): List of email addresses to send to.
+        """
+        if not recipients:
+            print("⚠️ Skipping Email: no recipients given")
+            return
+
+        _, _, sender_email, sender_password = _smtp_config()
+
+        if not sender_email or not sender_password:
+            print("⚠️ Skipping Email: SMTP_EMAIL or SMTP_PASSWORD not set in .env")
+            return
+
+        # Create Message. The body always contains non-ASCII (the footer
+        # emoji) and long lines, so set_content settles on utf-8 with
+        # quoted-printable - still a win over the old MIMEText path, which
+        # base64-encoded the body (~1.0x vs ~1.33x serialized size, since
+        # the HTML is almost entirely ASCII).
+        msg = EmailMessage()
+        msg["Subject"] = subject
+        msg["From"] = f"Luxvance Bot <{sender_email}>"
+        msg["To"] = ", ".join(recipients)
+
+        # HTML Body: static head + report body + timestamped footer
+        full_html = _HTML_HEAD + html_content + _HTML_FOOT_FMT % datetime.datetime.now().strftime('%Y-%m-%d %H:%M')
+
+        msg.set_content(full_html, subtype="html")
+
+        # Send over the pooled connection. send_message serializes the MIME
+        # tree straight to bytes, skipping the as_string() str build plus
+        # the extra str->bytes encode that sendmail would do.
+        try:
+            server = self._get_connection()
+            server.send_message(msg, from_addr=sender_email, to_addrs=recipients)
+            print(f"✅ Email sent to: {recipients}")
+        except Exception as e:
+            print(f"❌ Failed to send email: {e}")
+
+
+# Shared default reporter so every caller in the process reuses one connection
+_default_reporter = EmailReporter()
+atexit.register(_default_reporter.close)
+
+def send_email_report(subject, html_content, recipients):
+    """
+    Sends an HTML email report using SMTP credentials from environment variables.
+
+    Thin wrapper around the shared EmailReporter instance so repeated
+    calls reuse one SMTP connection.
+
+    Args:
+        subject (str): The subject line of the email.
+        html_content (str): The HTML body of the email.
+        recipients (list): List of email addresses to send to.
+    """
+    _default_reporter.send(subject, html_content, recipients)
+
+
+def send_personalized_reports(emails, max_workers=8):
+    """
+    Sends one personalized email per recipient over a small thread pool.
+
+    For identical bodies, send_email_report's single shared envelope is
+    strictly cheaper - use this only when each recipient needs their own
+    subject/body. smtplib connections aren't thread-safe, so every worker
+    thread gets its own EmailReporter; the per-connection TLS handshake
+    and login then overlap across workers instead of running back to
+    back, and each connection is reused for all sends on its thread.
+
+    Args:
+        emails: Iterable of (subject, html_content, recipient) tuples.
+        max_workers: Upper bound on concurrent SMTP connections.
+    """
+    emails = list(emails)
+    if not emails:
+        return
+
+    local = threading.local()
+    reporters = []
+
+    def _send(item):
+        subject, html_content, recipient = item
+        reporter = getattr(local, 'reporter', None)
+        if reporter is None:
+            reporter = local.reporter = EmailReporter()
+            reporters.append(reporter)
+        reporter.send(subject, html_content, [recipient])
+
+    workers = min(max_workers, len(emails))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_send, emails))
+
+    for reporter in reporters:
+        reporter.close()
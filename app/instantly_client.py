@@ -1,5 +1,18 @@
+import functools
 import requests
-import os
+from urllib3.util.retry import Retry
+
+from app.config import _parse_instantly_keys
+
+# orjson decodes the large paginated payloads (/emails, /campaigns,
+# analytics) 2-3x faster than stdlib json; fall back transparently when
+# it isn't installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json as _json
+    _json_loads = _json.loads
 
 class InstantlyClient:
     BASE_URL = "https://api.instantly.ai/api/v2"
@@ -9,7 +22,38 @@ class InstantlyClient:
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
         }
+        # One pooled session per client: reuses the TCP+TLS connection to
+        # api.instantly.ai across paginated calls instead of handshaking
+        # on every request.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Retry transient failures (429/5xx) with exponential backoff at the
+        # adapter level, honoring Retry-After. Retries happen below the
+        # pagination loops, so a transient error mid-pull doesn't throw away
+        # the pages already fetched.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Closes the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def request(self, method, path, params=None, json=None):
         """
@@ -30,18 +74,17 @@ class InstantlyClient:
         url = f"{self.BASE_URL}{path}"
         
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
-                headers=self.headers,
                 params=params,
                 json=json,
-                timeout=30 
+                timeout=30
             )
             response.raise_for_status()
             
             try:
-                return response.json()
+                return _json_loads(response.content)
             except ValueError:
                 return response.text
                 
@@ -58,28 +101,13 @@ class InstantlyClient:
         """Helper to fetch campaigns."""
         return self.request("GET", "/campaigns")
         
+@functools.lru_cache(maxsize=1)
 def load_clients():
     """
     Dynamically loads all Instantly clients from environment variables.
     Looks for keys starting with INSTANTLY_API_KEY_
+
+    The client map is cached; call load_clients.cache_clear() (and
+    config._parse_instantly_keys.cache_clear()) to pick up env changes.
     """
-    clients = {}
-    
-    # Load all keys starting with INSTANTLY_API_KEY_
-    for key, val in os.environ.items():
-        if key.startswith("INSTANTLY_API_KEY_"):
-            # Extract client name from key (e.g. INSTANTLY_API_KEY_LUXVANCE -> Luxvance)
-            client_name_raw = key.replace("INSTANTLY_API_KEY_", "")
-            
-            # Formatting: LUXVANCE -> Luxvance, GLOBAL_FOOD_VENTURES -> Global Food Ventures
-            client_name = client_name_raw.replace("_", " ").title()
-            
-            # Special manual fixups
-            if client_name.upper() == "CAMB AI": client_name = "CAMB.ai"
-            if client_name.upper() == "KCAL": client_name = "Kcal" 
-            if client_name.upper() == "CAPQUEST": client_name = "CapQuest"
-            if client_name.upper() == "INSURANCE MARKET": client_name = "Insurance Market"
-            
-            clients[client_name] = InstantlyClient(val)
-            
-    return clients
+    return {name: InstantlyClient(val) for name, val in _parse_instantly_keys()}
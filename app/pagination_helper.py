@@ -1,45 +1,168 @@
 """
 Helper function to fetch ALL items from paginated Instantly API endpoints
 """
+import concurrent.futures
 
-def fetch_all_paginated(client, endpoint, initial_params=None, max_pages=20):
+def fetch_all_paginated(client, endpoint, initial_params=None, max_pages=20,
+                        limit=100, stop_when=None, filter_fn=None, max_items=None):
     """
     Fetch all items from a paginated Instantly API endpoint.
-    
+
     Args:
         client: InstantlyClient instance
         endpoint: API endpoint path (e.g., '/accounts', '/campaigns')
         initial_params: Dict of initial query parameters (optional)
         max_pages: Maximum number of pages to fetch (safety limit)
-    
+        limit: Page size requested from the API; a page shorter than this
+            means there are no more pages, so the trailing empty-page
+            round trip is skipped
+        stop_when: Optional predicate; once an item matches, paging stops
+            after the current page ("find first" callers don't pull
+            every page)
+        filter_fn: Optional predicate applied while accumulating, so
+            callers don't re-walk the full list just to filter it
+        max_items: Stop paging once this many (filtered) items are kept
+
     Returns:
-        list: All items from all pages
+        list: All items from all pages (after filter_fn, if given)
     """
     all_items = []
     cursor = None
     page = 1
-    
+
     while page <= max_pages:
         # Build params
         params = initial_params.copy() if initial_params else {}
+        params.setdefault('limit', limit)
         if cursor:
             params['starting_after'] = cursor
-        
+
         # Fetch page
         response = client.request("GET", endpoint, params=params)
         items = response.get('items', [])
-        
+
         if not items:
             break
-        
-        all_items.extend(items)
+
+        if filter_fn is not None:
+            all_items.extend(filter(filter_fn, items))
+        else:
+            all_items.extend(items)
         print(f"  📄 Page {page}: {len(items)} items (total so far: {len(all_items)})")
-        
+
+        if max_items is not None and len(all_items) >= max_items:
+            del all_items[max_items:]
+            break
+
+        if stop_when is not None and any(stop_when(item) for item in items):
+            break
+
+        # A short page guarantees this was the last one
+        if len(items) < params['limit']:
+            break
+
         # Check for next page
         cursor = response.get('next_starting_after')
         if not cursor:
             break
-        
+
         page += 1
-    
+
     return all_items
+
+
+def fetch_paginated_reduce(client, endpoint, key_fn, filter_fn=None,
+                           initial_params=None, max_pages=20, limit=100):
+    """
+    Fetch a paginated endpoint and keep only the best item, page by page.
+
+    Avoids materializing the full item list just to run max() over it:
+    each page is consumed as it arrives and only the current best item is
+    retained.
+
+    Args:
+        client: InstantlyClient instance
+        endpoint: API endpoint path (e.g., '/campaigns')
+        key_fn: Ranking function; the item with the highest key wins
+        filter_fn: Optional predicate items must pass to be considered
+        initial_params: Dict of initial query parameters (optional)
+        max_pages: Maximum number of pages to fetch (safety limit)
+        limit: Page size requested from the API
+
+    Returns:
+        The best matching item, or None if nothing passed the filter
+    """
+    best = None
+    best_key = None
+    cursor = None
+    page = 1
+
+    while page <= max_pages:
+        params = initial_params.copy() if initial_params else {}
+        params.setdefault('limit', limit)
+        if cursor:
+            params['starting_after'] = cursor
+
+        response = client.request("GET", endpoint, params=params)
+        items = response.get('items', [])
+
+        if not items:
+            break
+
+        for item in items:
+            if filter_fn is not None and not filter_fn(item):
+                continue
+            key = key_fn(item)
+            if best is None or key > best_key:
+                best, best_key = item, key
+
+        if len(items) < params['limit']:
+            break
+
+        cursor = response.get('next_starting_after')
+        if not cursor:
+            break
+
+        page += 1
+
+    return best
+
+
+def fetch_all_clients(clients, endpoint, initial_params=None, max_pages=20, max_workers=16):
+    """
+    Fetch a paginated endpoint for several clients in parallel.
+
+    Cursor pagination is inherently sequential per client, so the
+    parallelism is across clients: each worker runs fetch_all_paginated
+    for one client on its own pooled session.
+
+    Args:
+        clients: Dict of {client_name: InstantlyClient}
+        endpoint: API endpoint path (e.g., '/accounts', '/campaigns')
+        initial_params: Dict of initial query parameters (optional)
+        max_pages: Maximum number of pages to fetch per client
+        max_workers: Upper bound on concurrent clients
+
+    Returns:
+        dict: {client_name: list of all items for that client}
+    """
+    results = {}
+
+    if not clients:
+        return results
+
+    workers = min(max_workers, len(clients))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(fetch_all_paginated, client, endpoint, initial_params, max_pages): name
+            for name, client in clients.items()
+        }
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"  ⚠️ Failed to fetch {endpoint} for {name}: {e}")
+                results[name] = []
+
+    return results
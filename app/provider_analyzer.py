@@ -1,25 +1,54 @@
 """
 Helper to analyze inbox placement results by email provider
 """
+import functools
+
+# Exact domain -> provider for the common cases, so categorization is a
+# single dict hash instead of a chain of substring scans per recipient.
+_PROVIDER_MAP = {
+    'gmail.com': 'Google',
+    'googlemail.com': 'Google',
+    'outlook.com': 'Microsoft',
+    'hotmail.com': 'Microsoft',
+    'live.com': 'Microsoft',
+    'msn.com': 'Microsoft',
+    'office365.com': 'Microsoft',
+    'yahoo.com': 'Yahoo',
+    'ymail.com': 'Yahoo',
+}
+
+# Display order for the report tables, and the fixed row index used by the
+# aggregation counters
+PROVIDER_ORDER = ('Google', 'Microsoft', 'Yahoo', 'Others')
+_PROVIDER_INDEX = {provider: i for i, provider in enumerate(PROVIDER_ORDER)}
+
+# Fallback on the first label to catch regional variants
+# (outlook.fr, hotmail.co.uk, yahoo.co.jp, ...)
+_PROVIDER_LABEL_MAP = {
+    'gmail': 'Google',
+    'googlemail': 'Google',
+    'outlook': 'Microsoft',
+    'hotmail': 'Microsoft',
+    'live': 'Microsoft',
+    'msn': 'Microsoft',
+    'office365': 'Microsoft',
+    'yahoo': 'Yahoo',
+    'ymail': 'Yahoo',
+}
+
+@functools.lru_cache(maxsize=4096)
+def _categorize_domain(domain):
+    provider = _PROVIDER_MAP.get(domain)
+    if provider:
+        return provider
+    return _PROVIDER_LABEL_MAP.get(domain.partition('.')[0], 'Others')
 
 def categorize_email_provider(email):
     """Categorize email by provider"""
-    domain = email.split('@')[-1].lower()
-    
-    # Gmail/Google Workspace
-    if 'gmail.com' in domain or 'googlemail.com' in domain:
-        return 'Google'
-    
-    # Microsoft (Outlook, Hotmail, Live, Office365)
-    if any(x in domain for x in ['outlook.', 'hotmail.', 'live.', 'msn.', 'office365.']):
-        return 'Microsoft'
-    
-    # Yahoo
-    if 'yahoo.' in domain or 'ymail.' in domain:
-        return 'Yahoo'
-    
-    # Others
-    return 'Others'
+    # rpartition avoids building a throwaway list like split('@') would.
+    # Large recipient lists repeat a handful of domains, so the per-domain
+    # result is memoized and most calls are a single cache hit.
+    return _categorize_domain(email.rpartition('@')[2].lower())
 
 
 def analyze_provider_breakdown(test_results):
@@ -35,62 +64,68 @@ def analyze_provider_breakdown(test_results):
     
     if 'recipients' not in test_results:
         return None
-    
+
     recipients = test_results['recipients']
-    
-    # Initialize counters
-    provider_stats = {
-        'Google': {'total': 0, 'inbox': 0, 'spam': 0, 'other': 0},
-        'Microsoft': {'total': 0, 'inbox': 0, 'spam': 0, 'other': 0},
-        'Yahoo': {'total': 0, 'inbox': 0, 'spam': 0, 'other': 0},
-        'Others': {'total': 0, 'inbox': 0, 'spam': 0, 'other': 0}
-    }
-    
-    # Process each recipient
-    for recipient in recipients:
-        if isinstance(recipient, str):
-            # Simple string format - test not complete yet
-            provider = categorize_email_provider(recipient)
-            provider_stats[provider]['total'] += 1
-        elif isinstance(recipient, dict):
-            # Full result format with placement data
-            email = recipient.get('email', '')
-            placement = recipient.get('placement', 'other').lower()
-            
-            provider = categorize_email_provider(email)
-            provider_stats[provider]['total'] += 1
-            
-            if 'inbox' in placement:
-                provider_stats[provider]['inbox'] += 1
-            elif 'spam' in placement:
-                provider_stats[provider]['spam'] += 1
-            else:
-                provider_stats[provider]['other'] += 1
-    
-    # Calculate rates
+
+    # Fixed 4x4 count table: row = provider index, cols = total/inbox/spam/
+    # other. Preallocating the rows avoids defaultdict factory calls and
+    # keeps each update to one list index and two increments.
+    counts = [[0, 0, 0, 0] for _ in PROVIDER_ORDER]
+    provider_index = _PROVIDER_INDEX
+
+    # The API returns a homogeneous list (plain strings before the test
+    # completes, dicts with placement data after), so partition once and run
+    # a tight loop per shape instead of an isinstance branch per recipient.
+    str_recipients = [r for r in recipients if type(r) is str]
+    dict_recipients = [r for r in recipients if type(r) is dict]
+
+    # Simple string format - test not complete yet
+    for recipient in str_recipients:
+        counts[provider_index[categorize_email_provider(recipient)]][0] += 1
+
+    # Full result format with placement data
+    for recipient in dict_recipients:
+        get = recipient.get
+        placement = get('placement', 'other').lower()
+        bucket = 1 if 'inbox' in placement else 2 if 'spam' in placement else 3
+
+        row = counts[provider_index[categorize_email_provider(get('email', ''))]]
+        row[0] += 1
+        row[bucket] += 1
+
+    # Calculate rates in one fused pass over the count table
     breakdown = {}
-    for provider, stats in provider_stats.items():
-        if stats['total'] > 0:
+    for provider, (total, inbox, spam, other) in zip(PROVIDER_ORDER, counts):
+        if total > 0:
             breakdown[provider] = {
-                'total': stats['total'],
-                'inbox_rate': round((stats['inbox'] / stats['total']) * 100, 1),
-                'spam_rate': round((stats['spam'] / stats['total']) * 100, 1),
-                'other_rate': round((stats['other'] / stats['total']) * 100, 1),
-                'inbox_count': stats['inbox'],
-                'spam_count': stats['spam'],
-                'other_count': stats['other']
+                'total': total,
+                'inbox_rate': round((inbox / total) * 100, 1),
+                'spam_rate': round((spam / total) * 100, 1),
+                'other_rate': round((other / total) * 100, 1),
+                'inbox_count': inbox,
+                'spam_count': spam,
+                'other_count': other
             }
-    
+
     return breakdown
 
 
+# Inbox-rate thresholds -> cell color (green / amber / red)
+_COLOR_STOPS = ((85, "#28a745"), (75, "#ffc107"), (0, "#dc3545"))
+
+def _rate_color(rate):
+    return next(color for threshold, color in _COLOR_STOPS if rate >= threshold)
+
+
 def format_provider_breakdown_html(breakdown):
     """Format provider breakdown as HTML table"""
-    
+
     if not breakdown:
         return "<p>Provider breakdown not available yet (test in progress)</p>"
-    
-    html = """
+
+    # Accumulate fragments and join once: repeated `html +=` re-copies the
+    # whole string on every row
+    parts = ["""
     <h3>📊 Provider Breakdown</h3>
     <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">
         <tr style="background: #0b333d; color: white;">
@@ -100,24 +135,17 @@ def format_provider_breakdown_html(breakdown):
             <th style="padding: 12px; text-align: center;">🚫 Spam</th>
             <th style="padding: 12px; text-align: center;">📂 Other</th>
         </tr>
-    """
-    
-    def get_color(rate):
-        if rate >= 85:
-            return "#28a745"
-        elif rate >= 75:
-            return "#ffc107"
-        else:
-            return "#dc3545"
-    
-    for provider in ['Google', 'Microsoft', 'Yahoo', 'Others']:
-        if provider in breakdown:
-            stats = breakdown[provider]
-            html += f"""
+    """]
+
+    for provider in PROVIDER_ORDER:
+        stats = breakdown.get(provider)
+        if stats is None:
+            continue
+        parts.append(f"""
         <tr style="background: #f8f9fa;">
             <td style="padding: 12px;"><strong>{provider}</strong></td>
             <td style="padding: 12px; text-align: center;">{stats['total']}</td>
-            <td style="padding: 12px; text-align: center; background: {get_color(stats['inbox_rate'])}; color: white;">
+            <td style="padding: 12px; text-align: center; background: {_rate_color(stats['inbox_rate'])}; color: white;">
                 <strong>{stats['inbox_rate']}%</strong><br>
                 <small>({stats['inbox_count']})</small>
             </td>
@@ -130,29 +158,30 @@ def format_provider_breakdown_html(breakdown):
                 <small>({stats['other_count']})</small>
             </td>
         </tr>
-            """
-    
-    html += """
+            """)
+
+    parts.append("""
     </table>
-    """
-    
-    return html
+    """)
+
+    return ''.join(parts)
 
 
 def format_provider_breakdown_text(breakdown):
     """Format provider breakdown as plain text"""
-    
+
     if not breakdown:
         return "Provider breakdown not available yet (test in progress)"
-    
-    text = "\n📊 Provider Breakdown:\n\n"
-    
-    for provider in ['Google', 'Microsoft', 'Yahoo', 'Others']:
-        if provider in breakdown:
-            stats = breakdown[provider]
-            text += f"{provider:12} | Total: {stats['total']:3} | "
-            text += f"Inbox: {stats['inbox_rate']:5.1f}% ({stats['inbox_count']:2}) | "
-            text += f"Spam: {stats['spam_rate']:5.1f}% ({stats['spam_count']:2}) | "
-            text += f"Other: {stats['other_rate']:5.1f}% ({stats['other_count']:2})\n"
-    
-    return text
+
+    parts = ["\n📊 Provider Breakdown:\n\n"]
+
+    for provider in PROVIDER_ORDER:
+        stats = breakdown.get(provider)
+        if stats is None:
+            continue
+        parts.append(f"{provider:12} | Total: {stats['total']:3} | ")
+        parts.append(f"Inbox: {stats['inbox_rate']:5.1f}% ({stats['inbox_count']:2}) | ")
+        parts.append(f"Spam: {stats['spam_rate']:5.1f}% ({stats['spam_count']:2}) | ")
+        parts.append(f"Other: {stats['other_rate']:5.1f}% ({stats['other_count']:2})\n")
+
+    return ''.join(parts)
@@ -18,22 +18,22 @@ def get_sent_email_from_campaign(client, campaign_id, limit=20):
     try:
         # Get sent emails from campaign
         # ue_type: 1 = sent from campaign, 2 = reply
+        # Filter server-side so we don't transfer/parse replies at all
         response = client.request('GET', '/emails', params={
             'limit': limit,
-            'campaign_id': campaign_id
+            'campaign_id': campaign_id,
+            'ue_type': 1
         })
-        
+
         emails = response.get('items', [])
-        
-        # Filter for sent emails only (not replies)
-        sent_emails = [e for e in emails if e.get('ue_type') == 1]
-        
-        if not sent_emails:
+
+        # Take the first sent email (most recent); the client-side check
+        # stays in case the server ignores the ue_type filter
+        email = next((e for e in emails if e.get('ue_type') == 1), None)
+
+        if email is None:
             return None
         
-        # Use the first sent email (most recent)
-        email = sent_emails[0]
-        
         # Extract subject
         subject = email.get('subject', '')
         
@@ -71,7 +71,7 @@ def get_best_campaign_copy_rendered(client):
     Returns:
         dict with subject, body, and campaign name
     """
-    from app.pagination_helper import fetch_all_paginated
+    from app.pagination_helper import fetch_paginated_reduce
     
     SAFE_TEMPLATE = {
         "subject": "Quick question",
@@ -85,15 +85,17 @@ Best regards"""
     }
     
     try:
-        # Get all campaigns
-        all_campaigns = fetch_all_paginated(client, "/campaigns")
-        active = [c for c in all_campaigns if c.get('status') == 1]
-        
-        if not active:
+        # Track the best active campaign (by reply rate) while paginating,
+        # instead of materializing every campaign and running max() after
+        best = fetch_paginated_reduce(
+            client, "/campaigns",
+            key_fn=lambda c: c.get('reply_rate', c.get('open_rate', 0)),
+            filter_fn=lambda c: c.get('status') == 1
+        )
+
+        if best is None:
             return {**SAFE_TEMPLATE, "name": "Safe Template (No Active Campaigns)"}
-        
-        # Sort by reply rate (best metric)
-        best = max(active, key=lambda c: c.get('reply_rate', c.get('open_rate', 0)))
+
         campaign_id = best['id']
         campaign_name = best.get('name', 'Best Campaign')
         
@@ -10,10 +10,14 @@ Features:
 - Email: Luxvance Branding (No Logo), Simplified Footer
 """
 
+import concurrent.futures
+import functools
 import os
+import re
 import sys
 import datetime
 import gspread
+import jinja2
 from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
 from collections import defaultdict
@@ -30,6 +34,9 @@ SHEET_ID = os.getenv("CONNECT_RESOURCES_SHEET_ID")
 CREDS_FILE = 'credentials.json'
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# Concurrent API requests; tune down via env if the Instantly rate limit bites
+MAX_FETCH_WORKERS = int(os.getenv("INSTANTLY_MAX_FETCH_WORKERS", "16"))
+
 # Luxvance Color Palette (Black & Gold)
 COLORS = {
     'header_dark': {'red': 0, 'green': 0, 'blue': 0},               # #000000 (Black)
@@ -44,8 +51,214 @@ COLORS = {
     'bg_white': {'red': 1, 'green': 1, 'blue': 1}
 }
 
+# Shared repeatCell 'cell' payloads, built once at import. Requests that
+# use the same style all reference the same dict, so the formatting batch
+# holds one object per style instead of a fresh nested literal per row -
+# smaller in memory and faster to JSON-serialize. Treat these as
+# read-only; nothing may mutate them after construction.
+_FMT_FIELDS = 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
+_FMT_FIELDS_V = 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)'
+
+FMT_TITLE = {'userEnteredFormat': {
+    'backgroundColor': COLORS['header_dark'],
+    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold'], 'fontSize': 14},
+    'horizontalAlignment': 'LEFT',
+    'verticalAlignment': 'MIDDLE'
+}}
+FMT_ALL_TIME_HEADER = {'userEnteredFormat': {
+    'backgroundColor': COLORS['header_dark'],
+    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_white'], 'fontSize': 12},
+    'horizontalAlignment': 'LEFT',
+    'verticalAlignment': 'MIDDLE'
+}}
+FMT_SECTION_HEADER = {'userEnteredFormat': {
+    'backgroundColor': COLORS['header_dark'],
+    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold'], 'fontSize': 12},
+    'horizontalAlignment': 'LEFT'
+}}
+FMT_COLUMN_HEADER = {'userEnteredFormat': {
+    'backgroundColor': COLORS['subheader_gray'],
+    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_white']},
+    'horizontalAlignment': 'CENTER'
+}}
+FMT_TOTAL_ROW = {'userEnteredFormat': {
+    'backgroundColor': COLORS['total_gold'],
+    'textFormat': {'bold': True, 'foregroundColor': COLORS['text_black'], 'fontSize': 11},
+    'horizontalAlignment': 'CENTER'
+}}
+FMT_TAB_HEADER = {'userEnteredFormat': {
+    'backgroundColor': COLORS['header_dark'],
+    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold']},
+    'horizontalAlignment': 'CENTER'
+}}
+FMT_WEEK_HEADER = {'userEnteredFormat': {
+    'backgroundColor': COLORS['week_header_gold'],
+    'textFormat': {'bold': True},
+    'horizontalAlignment': 'LEFT'
+}}
+FMT_WEEKLY_TOTAL = {'userEnteredFormat': {
+    'backgroundColor': COLORS['total_gold'],
+    'textFormat': {'bold': True},
+    'horizontalAlignment': 'LEFT'
+}}
+FMT_GRAND_TOTAL = {'userEnteredFormat': {
+    'backgroundColor': COLORS['grand_total_black'],
+    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold']},
+    'horizontalAlignment': 'LEFT'
+}}
+
+# Weekly email template, compiled once at import. main() used to rebuild
+# the ~4KB HTML body as a giant f-string on every run; the precompiled
+# jinja2 template parses the literal exactly once per process and each
+# render is only placeholder substitution. The bytecode cache persists
+# the compiled template across cron invocations (this script runs cold
+# every week), so warm-disk starts skip the parse+compile step and just
+# marshal.load the cached code; auto_reload=False keeps jinja from
+# stat-ing the source on every lookup. The template is registered under a
+# name (from_string templates bypass the bytecode cache).
+_REPORT_HTML = """
+        <style>
+            .cr-report { font-family: Arial, sans-serif; color: #333; max-width: 600px; margin: 0 auto; border: 1px solid #e0e0e0; border-radius: 8px; overflow: hidden; }
+            .cr-head { background-color: #000000; padding: 20px; text-align: center; }
+            .cr-head h2 { margin: 0; font-size: 24px; }
+            .cr-range { font-size: 14px; background-color: #222; padding: 4px 12px; border-radius: 4px; }
+            .cr-section { padding: 25px 20px 15px 20px; }
+            .cr-section-title { text-align: center; margin-bottom: 20px; }
+            .cr-section-title h3 { margin: 0; text-transform: uppercase; }
+            .cr-row { width: 100%; text-align: center; font-size: 0; }
+            .cr-cell { display: inline-block; width: 33%; padding: 10px 0; vertical-align: top; font-size: 12px; box-sizing: border-box; }
+            .cr-mid-w { border-left: 1px solid #eee; border-right: 1px solid #eee; }
+            .cr-mid-a { border-left: 1px solid #e0e0e0; border-right: 1px solid #e0e0e0; }
+            .cr-big { font-size: 28px; font-weight: bold; }
+            .cr-lbl { font-size: 11px; color: #666; text-transform: uppercase; letter-spacing: 1px; }
+            .cr-rate { font-size: 11px; margin-top: 4px; font-weight: bold; }
+            .cr-mid-num { font-size: 22px; font-weight: bold; }
+            .cr-lbl-sm { font-size: 10px; color: #888; text-transform: uppercase; letter-spacing: 1px; }
+            .cr-rate-sm { font-size: 10px; margin-top: 2px; }
+            .cr-divider { height: 1px; background: linear-gradient(to right, #fff, #D4AF37, #fff); margin: 0 20px; }
+            .cr-alltime { padding: 20px 20px 30px 20px; background-color: #FAFAFA; }
+            .cr-cta { margin-top: 35px; text-align: center; }
+            .cr-cta a { padding: 12px 30px; text-decoration: none; border-radius: 4px; font-weight: bold; display: inline-block; border: 1px solid #D4AF37; font-size: 14px; }
+        </style>
+        <div class="cr-report">
+            <!-- Header -->
+            <div class="cr-head">
+                <h2 style="color: #D4AF37;">Connect Resources Report - Week {{ iso_week }}</h2>
+                <div style="margin-top: 8px;">
+                    <span class="cr-range" style="color: #FFFFFF;">{{ start_fmt }} to {{ end_fmt }}</span>
+                </div>
+            </div>
+
+            <!-- Weekly Metrics -->
+            <div class="cr-section">
+                <div class="cr-section-title">
+                    <h3 style="color: #000; font-size: 16px;">Weekly Performance</h3>
+                </div>
+                <div class="cr-row">
+                    <div class="cr-cell">
+                        <div class="cr-big" style="color: #000000;">{{ week_sent }}</div>
+                        <div class="cr-lbl">Emails Sent</div>
+                    </div><div class="cr-cell cr-mid-w">
+                        <div class="cr-big" style="color: #D4AF37;">{{ week_replies }}</div>
+                        <div class="cr-lbl">Replies</div>
+                        <div class="cr-rate" style="color: #D4AF37;">Rate: {{ week_reply_rate }}</div>
+                    </div><div class="cr-cell">
+                        <div class="cr-big" style="color: #000000;">{{ week_opps }}</div>
+                        <div class="cr-lbl">Opportunities</div>
+                        <div class="cr-rate" style="color: #000;">Rate: {{ week_opp_rate }}</div>
+                    </div>
+                </div>
+            </div>
+
+            <!-- Divider -->
+            <div class="cr-divider"></div>
+
+            <!-- All-Time Metrics -->
+            <div class="cr-alltime">
+                <div class="cr-section-title">
+                    <h3 style="color: #666; font-size: 14px;">All-Time Performance</h3>
+                </div>
+                <div class="cr-row">
+                    <div class="cr-cell">
+                        <div class="cr-mid-num" style="color: #444;">{{ all_time_sent }}</div>
+                        <div class="cr-lbl-sm">Total Sent</div>
+                    </div><div class="cr-cell cr-mid-a">
+                        <div class="cr-mid-num" style="color: #BFAE58;">{{ all_time_replies }}</div>
+                        <div class="cr-lbl-sm">Total Replies</div>
+                        <div class="cr-rate-sm" style="color: #BFAE58;">Rate: {{ all_time_reply_rate }}</div>
+                    </div><div class="cr-cell">
+                        <div class="cr-mid-num" style="color: #444;">{{ all_time_opps }}</div>
+                        <div class="cr-lbl-sm">Total Opps</div>
+                        <div class="cr-rate-sm" style="color: #444;">Rate: {{ all_time_opp_rate }}</div>
+                    </div>
+                </div>
+
+                <div class="cr-cta">
+                    <a href="https://docs.google.com/spreadsheets/d/{{ sheet_id }}" style="background-color: #000000; color: #D4AF37;">
+                        View Master Dashboard
+                    </a>
+                </div>
+            </div>
+        </div>
+        """
+
+_JINJA_CACHE_DIR = "/tmp/connect_jinja_cache"
+os.makedirs(_JINJA_CACHE_DIR, exist_ok=True)
+
+# Inter-tag indentation carries no meaning in the report markup, and the
+# placeholders never emit tags or stray whitespace - so the source is
+# minified once here and the compiled template's static chunks are
+# already frozen in final form. Renders then need no per-run pass over
+# the output; jinja just joins the prebuilt constants with the values.
+_WS_RE = re.compile(r">\s+<")
+_REPORT_HTML = _WS_RE.sub("><", _REPORT_HTML).strip()
+
+# SHEET_ID is fixed for the life of the process, so the dashboard link is
+# baked into the template source here rather than resolved on every
+# render - one placeholder fewer per run
+_REPORT_HTML = _REPORT_HTML.replace("{{ sheet_id }}", SHEET_ID or "")
+
+_ENV = jinja2.Environment(
+    loader=jinja2.DictLoader({'weekly_report.html': _REPORT_HTML}),
+    autoescape=True,
+    auto_reload=False,
+    bytecode_cache=jinja2.FileSystemBytecodeCache(
+        directory=_JINJA_CACHE_DIR, pattern="%s.cache"
+    ),
+)
+_REPORT_TMPL = _ENV.get_template('weekly_report.html')
+
+@functools.lru_cache(maxsize=4096)
+def fmt_int(n):
+    """Thousands-separated integer for sheet cells; cached because row
+    values repeat heavily (zeros especially)."""
+    return format(n, ',')
+
+@functools.lru_cache(maxsize=1024)
+def fmt_pct(n):
+    """One-decimal percentage string for sheet cells, cached like fmt_int."""
+    return f"{n:.1f}%"
+
+@functools.lru_cache(maxsize=2048)
+def _parse_iso(s, _date=datetime.date):
+    """Parse a 'YYYY-MM-DD' string to a date.
+
+    Direct int slicing is ~10x faster than strptime, which builds a format
+    parser plus an intermediate datetime per call - this runs once per
+    daily analytics record. Memoized because every campaign reports the
+    same calendar dates, so there are only a few hundred distinct strings
+    across tens of thousands of records.
+    """
+    return _date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+
+@functools.lru_cache(maxsize=512)
 def get_week_info(date_obj):
-    """Get ISO week number and date range for a given date"""
+    """Get ISO week number and date range for a given date.
+
+    Called once per daily analytics record but there are only ~52 distinct
+    weeks a year, so the isocalendar/timedelta/strftime work is memoized
+    and repeat dates cost a dict lookup.
+    """
     iso_year, iso_week, _ = date_obj.isocalendar()
     monday = date_obj - datetime.timedelta(days=date_obj.weekday())
     sunday = monday + datetime.timedelta(days=6)
@@ -57,50 +270,88 @@ def get_week_info(date_obj):
         'label': f"Week {iso_week} (Monday, {monday.strftime('%b %d')} - Sunday, {sunday.strftime('%b %d, %Y')})"
     }
 
-def fetch_all_data(client):
-    """Fetch all data starting from 2024 to capture 'All Time'"""
-    print("\n📊 Fetching all data (from 2024-01-01)...")
-    
-    start_date = datetime.date(2024, 1, 1)
-    end_date = datetime.date.today()
-    start_str = start_date.strftime('%Y-%m-%d')
-    end_str = end_date.strftime('%Y-%m-%d')
-    
-    # Fetch campaigns
-    print("  → Fetching campaigns...")
+def suffix(d):
+    """Ordinal suffix for a day of month (1st, 2nd, 3rd, 4th...)."""
+    return 'th' if 11 <= d <= 13 else {1: 'st', 2: 'nd', 3: 'rd'}.get(d % 10, 'th')
+
+@functools.lru_cache(maxsize=8)
+def _week_labels(year):
+    """Week-number -> display label for every ISO week touching a year.
+
+    Built once per year (52-53 strftime pairs total) so the aggregation
+    and render paths never format week labels per record. Walks Mondays
+    from the week containing Jan 1 through Dec 31.
+    """
+    jan1 = datetime.date(year, 1, 1)
+    monday = jan1 - datetime.timedelta(days=jan1.weekday())
+    dec31 = datetime.date(year, 12, 31)
+    one_week = datetime.timedelta(days=7)
+    six_days = datetime.timedelta(days=6)
+    labels = {}
+    while monday <= dec31:
+        sunday = monday + six_days
+        iso_week = monday.isocalendar()[1]
+        labels[iso_week] = (
+            f"Week {iso_week} (Monday, {monday.strftime('%b %d')} - "
+            f"Sunday, {sunday.strftime('%b %d, %Y')})"
+        )
+        monday += one_week
+    return labels
+
+@functools.lru_cache(maxsize=8)
+def _week_by_day(year):
+    """ISO-date-string -> ISO week number for every day of a year.
+
+    365-366 isocalendar calls up front replace one per record in the
+    aggregation loop; after that a week lookup is a plain dict hop on the
+    raw date string, no date object involved.
+    """
+    d = datetime.date(year, 1, 1)
+    one_day = datetime.timedelta(days=1)
+    table = {}
+    while d.year == year:
+        table[d.isoformat()] = d.isocalendar()[1]
+        d += one_day
+    return table
+
+def fetch_campaigns_prefetched(client, page_size=100, prefetch=8):
+    """Fetch all campaigns, prefetching pages in parallel.
+
+    /campaigns paginates by numeric skip, so a batch of speculative page
+    requests (skip=0,100,200,...) can be in flight at once; the loop
+    consumes them in order and stops at the first short/empty page.
+    """
     campaigns = []
     skip = 0
-    while True:
-        resp = client.request("GET", "/campaigns", params={"limit": 100, "skip": skip})
-        items = resp.get('items', []) if isinstance(resp, dict) else resp if isinstance(resp, list) else []
-        if not items:
-            break
-        campaigns.extend(items)
-        if len(items) < 100:
-            break
-        skip += 100
-    print(f"  ✓ Found {len(campaigns)} campaigns")
-    
-    # Fetch campaign daily analytics
-    print("  → Fetching campaign analytics...")
-    campaign_analytics = {}
-    for camp in campaigns:
-        c_id = camp.get('id')
-        daily_stats = client.request("GET", "/campaigns/analytics/daily", params={
-            "campaign_id": c_id,
-            "start_date": start_str,
-            "end_date": end_str
-        })
-        if daily_stats and isinstance(daily_stats, list):
-            campaign_analytics[c_id] = daily_stats
-    print(f"  ✓ Fetched analytics for {len(campaign_analytics)} campaigns")
-    
-    # Fetch accounts
-    print("  → Fetching accounts...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=prefetch) as ex:
+        while True:
+            futures = [
+                ex.submit(client.request, "GET", "/campaigns",
+                          params={"limit": page_size, "skip": skip + i * page_size})
+                for i in range(prefetch)
+            ]
+            done = False
+            for future in futures:
+                resp = future.result()
+                items = resp.get('items', []) if isinstance(resp, dict) else resp if isinstance(resp, list) else []
+                if not items:
+                    done = True
+                    break
+                campaigns.extend(items)
+                if len(items) < page_size:
+                    done = True
+                    break
+            if done:
+                break
+            skip += prefetch * page_size
+    return campaigns
+
+def fetch_accounts(client, page_size=100):
+    """Fetch all accounts (cursor pagination, necessarily serial)."""
     accounts = []
     starting_after = None
     while True:
-        params = {"limit": 100}
+        params = {"limit": page_size}
         if starting_after:
             params["starting_after"] = starting_after
         resp = client.request("GET", "/accounts", params=params)
@@ -112,129 +363,267 @@ def fetch_all_data(client):
             starting_after = resp['next_starting_after']
         else:
             break
+    return accounts
+
+def fetch_all_data(client):
+    """Fetch all data starting from 2024 to capture 'All Time'"""
+    print("\n📊 Fetching all data (from 2024-01-01)...")
+
+    start_date = datetime.date(2024, 1, 1)
+    end_date = datetime.date.today()
+    start_str = start_date.strftime('%Y-%m-%d')
+    end_str = end_date.strftime('%Y-%m-%d')
+
+    # The three top-level pulls have no dependency on each other, so they
+    # run overlapped; campaign analytics starts as soon as campaigns land.
+    print("  → Fetching campaigns, accounts and account analytics...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as ex:
+        campaigns_future = ex.submit(fetch_campaigns_prefetched, client)
+        accounts_future = ex.submit(fetch_accounts, client)
+        account_analytics_future = ex.submit(
+            client.request, "GET", "/accounts/analytics/daily",
+            params={"start_date": start_str, "end_date": end_str})
+
+        campaigns = campaigns_future.result()
+        print(f"  ✓ Found {len(campaigns)} campaigns")
+        accounts = accounts_future.result()
+        account_analytics = account_analytics_future.result()
+
+    # Fetch campaign daily analytics (parallel: one request per campaign,
+    # I/O-bound so wall time is roughly one RTT per pool batch)
+    print("  → Fetching campaign analytics...")
+    campaign_analytics = {}
+    if campaigns:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as ex:
+            futures = {
+                ex.submit(client.request, "GET", "/campaigns/analytics/daily", params={
+                    "campaign_id": camp.get('id'),
+                    "start_date": start_str,
+                    "end_date": end_str
+                }): camp.get('id')
+                for camp in campaigns
+            }
+            for future in concurrent.futures.as_completed(futures):
+                daily_stats = future.result()
+                if daily_stats and isinstance(daily_stats, list):
+                    campaign_analytics[futures[future]] = daily_stats
+    print(f"  ✓ Fetched analytics for {len(campaign_analytics)} campaigns")
     print(f"  ✓ Found {len(accounts)} accounts")
-    
-    # Fetch account daily analytics
-    print("  → Fetching account analytics...")
-    account_analytics = client.request("GET", "/accounts/analytics/daily", params={
-        "start_date": start_str,
-        "end_date": end_str
-    })
-    print(f"  ✓ Fetched {len(account_analytics) if isinstance(account_analytics, list) else 0} daily records")
-    
+    print(f"  ✓ Fetched {len(account_analytics) if isinstance(account_analytics, list) else 0} account daily records")
+
+    # Flatten the raw per-campaign payloads into one parsed table shared by
+    # every downstream aggregation, so dates are parsed and dict fields
+    # extracted exactly once instead of once per consuming loop:
+    #   (date_str, date_obj, campaign_name, sent, new_leads, replies, opps)
+    campaign_names = {c.get('id'): c.get('name', 'Unnamed') for c in campaigns}
+    daily_stats = []
+    append = daily_stats.append
+    for c_id, days in campaign_analytics.items():
+        c_name = campaign_names.get(c_id, 'Unnamed')
+        for day in days:
+            get = day.get
+            date_str = get('date')
+            if not date_str: continue
+            append((
+                date_str,
+                _parse_iso(date_str),
+                c_name,
+                get('sent', 0),
+                get('new_leads_contacted', 0),
+                get('unique_replies', 0),
+                get('opportunities', 0)
+            ))
+
     return {
         'campaigns': campaigns,
         'campaign_analytics': campaign_analytics,
+        'daily_stats': daily_stats,
+        'aggregates': compute_aggregates(daily_stats),
         'accounts': accounts,
         'account_analytics': account_analytics,
         'start_date': start_date,
         'end_date': end_date
     }
 
-def create_master_dashboard(sh, data):
+def compute_aggregates(daily_stats, target_year=2026):
+    """Compute every report aggregate in one pass over the daily table.
+
+    The dashboard (per-month + all-time), campaigns tab (per-week per-
+    campaign), and email summary (current week + all-time) all reduce the
+    same records, so their totals are produced together here instead of
+    in three separate loops.
+    """
+    # Flat per-'YYYY-MM' buckets as [sent, new_leads, replies, opps] lists:
+    # one dict hop per record instead of two defaultdict layers, and the
+    # year is recoverable from the key prefix
+    monthly = defaultdict(lambda: [0, 0, 0, 0])
+    # Per (week_num, week_label, campaign_name), target year only
+    week_camp_data = defaultdict(lambda: {
+        'sent': 0, 'new_leads': 0, 'replies': 0, 'opportunities': 0
+    })
+    # Scalar locals for the single-bucket totals: plain integer adds in the
+    # loop, folded back into dicts once at the end
+    at_sent = at_leads = at_replies = at_opps = 0
+    tw_sent = tw_leads = tw_replies = tw_opps = 0
+
+    today = datetime.date.today()
+    week_start = today - datetime.timedelta(days=today.weekday())
+    week_end = week_start + datetime.timedelta(days=6)
+
+    # ISO date strings sort lexicographically, so the year and this-week
+    # membership tests run on the raw strings - no date-object comparisons
+    # in the hot loop
+    target_prefix = str(target_year)
+    week_start_str = week_start.isoformat()
+    week_end_str = week_end.isoformat()
+    week_by_day = _week_by_day(target_year)
+
+    for date_str, date_obj, c_name, s, nl, r, o in daily_stats:
+        month_stats = monthly[date_str[:7]]
+        month_stats[0] += s
+        month_stats[1] += nl
+        month_stats[2] += r
+        month_stats[3] += o
+
+        at_sent += s
+        at_leads += nl
+        at_replies += r
+        at_opps += o
+
+        # Days with no sends/replies/opportunities don't make it into the
+        # weekly buckets at all (the render path used to filter these rows
+        # out anyway), keeping the dict small for inactive campaigns
+        if date_str[:4] == target_prefix and (s or r or o):
+            # Key by week number only; labels are resolved at render time
+            # from the per-year lookup table
+            week_stats = week_camp_data[(week_by_day[date_str], c_name)]
+            week_stats['sent'] += s
+            week_stats['new_leads'] += nl
+            week_stats['replies'] += r
+            week_stats['opportunities'] += o
+
+        if week_start_str <= date_str <= week_end_str:
+            tw_sent += s
+            tw_leads += nl
+            tw_replies += r
+            tw_opps += o
+
+    return {
+        'monthly': monthly,
+        'week_camp_data': week_camp_data,
+        'all_time': {'sent': at_sent, 'new_leads': at_leads,
+                     'replies': at_replies, 'opportunities': at_opps},
+        'this_week': {'sent': tw_sent, 'new_leads': tw_leads,
+                      'replies': tw_replies, 'opportunities': tw_opps},
+        'week_start': week_start,
+        'week_end': week_end,
+    }
+
+def rebuild_worksheets(sh, tab_specs):
+    """Delete and recreate the report tabs in one batchUpdate.
+
+    Replaces the per-tab del_worksheet/add_worksheet call pairs (two REST
+    calls each) with a single batch; deletes and adds are interleaved so
+    the spreadsheet never momentarily has zero sheets. Also drops the
+    legacy "Agents 2026" tab if present. Returns {title: Worksheet}.
+    """
+    existing = {w.title: w.id for w in sh.worksheets()}
+
+    requests = []
+    for index, (title, row_count, col_count) in enumerate(tab_specs):
+        if title in existing:
+            requests.append({'deleteSheet': {'sheetId': existing[title]}})
+        requests.append({
+            'addSheet': {
+                'properties': {
+                    'title': title,
+                    'index': index,
+                    'gridProperties': {'rowCount': row_count, 'columnCount': col_count}
+                }
+            }
+        })
+    if "Agents 2026" in existing:
+        requests.append({'deleteSheet': {'sheetId': existing["Agents 2026"]}})
+
+    response = sh.batch_update({'requests': requests})
+
+    worksheets = {}
+    for reply in response.get('replies', []):
+        if 'addSheet' in reply:
+            props = reply['addSheet']['properties']
+            worksheets[props['title']] = gspread.Worksheet(sh, props)
+    return worksheets
+
+def create_master_dashboard(ws, data):
     """Create Master Dashboard (Tab 1) - All Time & Monthly"""
     tab_name = "Master Dashboard"
     print(f"\n📋 Creating {tab_name}...")
     
-    # Aggregate by Year-Month
-    year_data = defaultdict(lambda: defaultdict(lambda: {
-        'sent': 0, 'new_leads': 0, 'replies': 0, 'opportunities': 0
-    }))
-    
-    # All Time Totals
-    all_time_totals = {'sent': 0, 'new_leads': 0, 'replies': 0, 'opportunities': 0}
+    # Pre-computed in compute_aggregates (single pass over the daily table)
+    monthly = data['aggregates']['monthly']
+    all_time_totals = data['aggregates']['all_time']
 
-    for camp in data['campaigns']:
-        c_id = camp.get('id')
-        daily_stats = data['campaign_analytics'].get(c_id, [])
-        for day in daily_stats:
-            date_str = day.get('date')
-            if not date_str: continue
-            
-            date_obj = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
-            year = date_obj.year
-            month_key = date_obj.strftime('%Y-%m') # YYYY-MM
-            
-            # Monthly Stats
-            year_data[year][month_key]['sent'] += day.get('sent', 0)
-            year_data[year][month_key]['new_leads'] += day.get('new_leads_contacted', 0)
-            year_data[year][month_key]['replies'] += day.get('unique_replies', 0)
-            year_data[year][month_key]['opportunities'] += day.get('opportunities', 0)
+    print(f"  ✓ Processed data for years: {sorted({int(k[:4]) for k in monthly})}")
+    
+    # Header section (rows 1-4 + spacer) as a single literal - one
+    # allocation instead of five appends; the monthly blocks extend it
+    rows = [
+        ['MASTER DASHBOARD', '', '', '', '', ''],
+        ['ALL TIME PERFORMANCE', '', '', '', '', ''],
+        ['Emails Sent', 'New Leads', 'Replies', 'Opportunities', '', ''],
+        [fmt_int(all_time_totals['sent']), fmt_int(all_time_totals['new_leads']), fmt_int(all_time_totals['replies']), fmt_int(all_time_totals['opportunities']), '', ''],
+        ['', '', '', '', '', ''],
+    ]
 
-            # All Time Stats
-            all_time_totals['sent'] += day.get('sent', 0)
-            all_time_totals['new_leads'] += day.get('new_leads_contacted', 0)
-            all_time_totals['replies'] += day.get('unique_replies', 0)
-            all_time_totals['opportunities'] += day.get('opportunities', 0)
+    # Partition month keys by year in one sorted pass instead of sorting
+    # a filtered view of the dict once per year section
+    months_2026 = []
+    months_2025 = []
+    for m in sorted(monthly):
+        if m.startswith('2026'):
+            months_2026.append(m)
+        elif m.startswith('2025'):
+            months_2025.append(m)
 
-    
-    print(f"  ✓ Processed data for years: {list(year_data.keys())}")
-    
-    # Build rows
-    rows = []
-    
-    # Header Section
-    rows.append(['MASTER DASHBOARD', '', '', '', '', '']) # Row 1
-    rows.append(['ALL TIME PERFORMANCE', '', '', '', '', '']) # Row 2
-    rows.append(['Emails Sent', 'New Leads', 'Replies', 'Opportunities', '', '']) # Row 3
-    rows.append([f"{all_time_totals['sent']:,}", f"{all_time_totals['new_leads']:,}", f"{all_time_totals['replies']:,}", f"{all_time_totals['opportunities']:,}", '', '']) # Row 4
-    rows.append(['', '', '', '', '', '']) # Spacer
-    
     # --- Performance by Month 2026 ---
-    stats_2026 = year_data.get(2026, {})
-    if stats_2026:
+    if months_2026:
         rows.append(['PERFORMANCE BY MONTH 2026', '', '', '', '', ''])
         rows.append(['Month', 'Emails Sent', 'New Leads', 'Replies', 'Opportunities', 'Emails/Opp'])
-        
-        sorted_months_2026 = sorted(stats_2026.keys())
-        for m in sorted_months_2026:
-            stats = stats_2026[m]
-            month_name = datetime.datetime.strptime(m, '%Y-%m').strftime('%B')
-            emails_per_opp = stats['sent'] / stats['opportunities'] if stats['opportunities'] > 0 else 0
+
+        for m in months_2026:
+            sent, new_leads, replies, opportunities = monthly[m]
+            month_name = calendar.month_name[int(m[5:7])]
+            emails_per_opp = sent / opportunities if opportunities > 0 else 0
             rows.append([
                 month_name,
-                f"{stats['sent']:,}",
-                f"{stats['new_leads']:,}",
-                f"{stats['replies']:,}",
-                f"{stats['opportunities']:,}",
+                fmt_int(sent),
+                fmt_int(new_leads),
+                fmt_int(replies),
+                fmt_int(opportunities),
                 f"{emails_per_opp:.1f}"
             ])
         rows.append(['', '', '', '', '', '']) # Spacer
 
     # --- Performance by Month 2025 ---
-    stats_2025 = year_data.get(2025, {})
-    if stats_2025:
+    if months_2025:
         rows.append(['PERFORMANCE BY MONTH 2025', '', '', '', '', ''])
         rows.append(['Month', 'Emails Sent', 'New Leads', 'Replies', 'Opportunities', 'Emails/Opp'])
-        
-        sorted_months_2025 = sorted(stats_2025.keys())
-        for m in sorted_months_2025:
-            stats = stats_2025[m]
-            month_name = datetime.datetime.strptime(m, '%Y-%m').strftime('%B')
-            emails_per_opp = stats['sent'] / stats['opportunities'] if stats['opportunities'] > 0 else 0
+
+        for m in months_2025:
+            sent, new_leads, replies, opportunities = monthly[m]
+            month_name = calendar.month_name[int(m[5:7])]
+            emails_per_opp = sent / opportunities if opportunities > 0 else 0
             rows.append([
                 month_name,
-                f"{stats['sent']:,}",
-                f"{stats['new_leads']:,}",
-                f"{stats['replies']:,}",
-                f"{stats['opportunities']:,}",
+                fmt_int(sent),
+                fmt_int(new_leads),
+                fmt_int(replies),
+                fmt_int(opportunities),
                 f"{emails_per_opp:.1f}"
             ])
             
-    # Delete and recreate
-    try:
-        ws = sh.worksheet(tab_name)
-        sh.del_worksheet(ws)
-    except:
-        pass
-    
-    ws = sh.add_worksheet(title=tab_name, rows=100, cols=10)
-    
-    # Write data
-    ws.update(values=rows, range_name='A1')
-    
-    # Apply formatting
-    print("  → Applying formatting...")
+    # Build formatting requests; merges and formats ride the same batch
+    print("  → Building formatting requests...")
     requests = []
 
     # Merge Calls
@@ -250,38 +639,23 @@ def create_master_dashboard(sh, data):
             'mergeType': 'MERGE_ALL'
         }
     })
-    
-    sh.batch_update({'requests': requests})
-    requests = [] # Reset for formatting
-    
+
     # Helper to format a block
     def format_headers_req(row_idx):
         # Header (Merged or single)
         requests.append({
             'repeatCell': {
                 'range': {'sheetId': ws.id, 'startRowIndex': row_idx, 'endRowIndex': row_idx+1, 'startColumnIndex': 0, 'endColumnIndex': 6},
-                'cell': {
-                    'userEnteredFormat': {
-                        'backgroundColor': COLORS['header_dark'],
-                        'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold'], 'fontSize': 12},
-                        'horizontalAlignment': 'LEFT'
-                    }
-                },
-                'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
+                'cell': FMT_SECTION_HEADER,
+                'fields': _FMT_FIELDS
             }
         })
         # Column Header (Next Row)
         requests.append({
             'repeatCell': {
                 'range': {'sheetId': ws.id, 'startRowIndex': row_idx+1, 'endRowIndex': row_idx+2, 'startColumnIndex': 0, 'endColumnIndex': 6},
-                'cell': {
-                    'userEnteredFormat': {
-                        'backgroundColor': COLORS['subheader_gray'],
-                        'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_white']},
-                        'horizontalAlignment': 'CENTER'
-                    }
-                },
-                'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
+                'cell': FMT_COLUMN_HEADER,
+                'fields': _FMT_FIELDS
             }
         })
 
@@ -289,61 +663,35 @@ def create_master_dashboard(sh, data):
     requests.append({
         'repeatCell': {
             'range': {'sheetId': ws.id, 'startRowIndex': 0, 'endRowIndex': 1, 'startColumnIndex': 0, 'endColumnIndex': 6},
-            'cell': {
-                'userEnteredFormat': {
-                    'backgroundColor': COLORS['header_dark'],
-                    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold'], 'fontSize': 14},
-                    'horizontalAlignment': 'LEFT',
-                    'verticalAlignment': 'MIDDLE'
-                }
-            },
-            'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)'
+            'cell': FMT_TITLE,
+            'fields': _FMT_FIELDS_V
         }
     })
-    
+
     # Row 2: All Time Header (LEFT Aligned)
     requests.append({
         'repeatCell': {
             'range': {'sheetId': ws.id, 'startRowIndex': 1, 'endRowIndex': 2, 'startColumnIndex': 0, 'endColumnIndex': 6},
-            'cell': {
-                'userEnteredFormat': {
-                    'backgroundColor': COLORS['header_dark'],
-                    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_white'], 'fontSize': 12},
-                    'horizontalAlignment': 'LEFT',
-                    'verticalAlignment': 'MIDDLE'
-                }
-            },
-            'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)'
+            'cell': FMT_ALL_TIME_HEADER,
+            'fields': _FMT_FIELDS_V
         }
     })
-    
+
     # Row 3: Column Headers
     requests.append({
         'repeatCell': {
             'range': {'sheetId': ws.id, 'startRowIndex': 2, 'endRowIndex': 3, 'startColumnIndex': 0, 'endColumnIndex': 6},
-            'cell': {
-                'userEnteredFormat': {
-                    'backgroundColor': COLORS['subheader_gray'],
-                    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_white']},
-                    'horizontalAlignment': 'CENTER'
-                }
-            },
-            'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
+            'cell': FMT_COLUMN_HEADER,
+            'fields': _FMT_FIELDS
         }
     })
-    
+
     # Row 4: Values (Total)
     requests.append({
         'repeatCell': {
             'range': {'sheetId': ws.id, 'startRowIndex': 3, 'endRowIndex': 4, 'startColumnIndex': 0, 'endColumnIndex': 6},
-            'cell': {
-                'userEnteredFormat': {
-                    'backgroundColor': COLORS['total_gold'], # Highlight total
-                    'textFormat': {'bold': True, 'foregroundColor': COLORS['text_black'], 'fontSize': 11},
-                    'horizontalAlignment': 'CENTER'
-                }
-            },
-            'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
+            'cell': FMT_TOTAL_ROW,
+            'fields': _FMT_FIELDS
         }
     })
     
@@ -353,74 +701,56 @@ def create_master_dashboard(sh, data):
             format_headers_req(i)
         elif row[0] == 'PERFORMANCE BY MONTH 2025':
             format_headers_req(i)
-            
-    sh.batch_update({'requests': requests})
-    print(f"  ✓ {tab_name} styled")
 
-def create_campaigns_tab(sh, data):
+    print(f"  ✓ {tab_name} prepared")
+    return rows, requests
+
+def create_campaigns_tab(ws, data):
     """Create Campaigns 2026 (Tab 2)"""
     tab_name = "Campaigns 2026"
     print(f"\n📅 Creating {tab_name}...")
     
-    target_year = 2026
+    # Pre-computed in compute_aggregates (single pass over the daily table)
+    week_camp_data = data['aggregates']['week_camp_data']
     
-    # Aggregate by (week, campaign_name)
-    week_camp_data = defaultdict(lambda: {
-        'sent': 0, 'new_leads': 0, 'replies': 0, 'opportunities': 0
-    })
+    # Build rows. The campaigns tab runs to ~500 rows, so bind the append
+    # method once rather than re-resolving the attribute in the hot loops
+    rows = [['Week', 'Campaign Name', 'Emails Sent', 'New Leads', 'Replies', 'Opportunities', 'Reply %', 'Opp %']]
+    append = rows.append
     
-    for camp in data['campaigns']:
-        c_id = camp.get('id')
-        c_name = camp.get('name', 'Unnamed')
-        
-        daily_stats = data['campaign_analytics'].get(c_id, [])
-        for day in daily_stats:
-            date_str = day.get('date')
-            if not date_str: continue
-            
-            date_obj = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
-            if date_obj.year != target_year: continue
-                
-            week_info = get_week_info(date_obj)
-            key = (week_info['week_num'], week_info['label'], c_name)
-            week_camp_data[key]['sent'] += day.get('sent', 0)
-            week_camp_data[key]['new_leads'] += day.get('new_leads_contacted', 0)
-            week_camp_data[key]['replies'] += day.get('unique_replies', 0)
-            week_camp_data[key]['opportunities'] += day.get('opportunities', 0)
-    
-    # Build rows
-    rows = []
-    rows.append(['Week', 'Campaign Name', 'Emails Sent', 'New Leads', 'Replies', 'Opportunities', 'Reply %', 'Opp %'])
-    
-    # Group by week
+    # Group by week; labels come from the precomputed per-year table
+    week_labels = _week_labels(2026)
     weeks = {}
-    for (week_num, week_label, c_name), stats in week_camp_data.items():
+    for (week_num, c_name), stats in week_camp_data.items():
         if week_num not in weeks:
-            weeks[week_num] = {'label': week_label, 'campaigns': {}}
+            weeks[week_num] = {'label': week_labels.get(week_num, f"Week {week_num}"), 'campaigns': {}}
         weeks[week_num]['campaigns'][c_name] = stats
     
     grand_totals = {'sent': 0, 'new_leads': 0, 'replies': 0, 'opportunities': 0}
     
-    for week_num in sorted(weeks.keys()):
-        week = weeks[week_num]
-        
+    # Week numbers live in [1, 53], so walking the full range with a
+    # membership test visits them in order without a sort
+    for week_num in range(1, 54):
+        week = weeks.get(week_num)
+        if week is None:
+            continue
+
+
         # Week header
-        rows.append([week['label'], '', '', '', '', '', '', ''])
+        append([week['label'], '', '', '', '', '', '', ''])
         
         # Campaign rows
         week_totals = {'sent': 0, 'new_leads': 0, 'replies': 0, 'opportunities': 0}
         
         for c_name in sorted(week['campaigns'].keys()):
             stats = week['campaigns'][c_name]
-            if stats['sent'] == 0 and stats['replies'] == 0 and stats['opportunities'] == 0: continue
-
             reply_pct = (stats['replies'] / stats['sent'] * 100) if stats['sent'] > 0 else 0
             opp_pct = (stats['opportunities'] / stats['sent'] * 100) if stats['sent'] > 0 else 0
             
-            rows.append([
+            append([
                 '', c_name,
-                f"{stats['sent']:,}", f"{stats['new_leads']:,}", f"{stats['replies']:,}", f"{stats['opportunities']:,}",
-                f"{reply_pct:.1f}%", f"{opp_pct:.1f}%"
+                fmt_int(stats['sent']), fmt_int(stats['new_leads']), fmt_int(stats['replies']), fmt_int(stats['opportunities']),
+                fmt_pct(reply_pct), fmt_pct(opp_pct)
             ])
             
             week_totals['sent'] += stats['sent']
@@ -432,12 +762,12 @@ def create_campaigns_tab(sh, data):
         week_reply_pct = (week_totals['replies'] / week_totals['sent'] * 100) if week_totals['sent'] > 0 else 0
         week_opp_pct = (week_totals['opportunities'] / week_totals['sent'] * 100) if week_totals['sent'] > 0 else 0
         
-        rows.append([
+        append([
             'WEEKLY TOTAL', '',
-            f"{week_totals['sent']:,}", f"{week_totals['new_leads']:,}", f"{week_totals['replies']:,}", f"{week_totals['opportunities']:,}",
-            f"{week_reply_pct:.1f}%", f"{week_opp_pct:.1f}%"
+            fmt_int(week_totals['sent']), fmt_int(week_totals['new_leads']), fmt_int(week_totals['replies']), fmt_int(week_totals['opportunities']),
+            fmt_pct(week_reply_pct), fmt_pct(week_opp_pct)
         ])
-        rows.append(['', '', '', '', '', '', '', '']) # Spacer
+        append(['', '', '', '', '', '', '', '']) # Spacer
         
         grand_totals['sent'] += week_totals['sent']
         grand_totals['new_leads'] += week_totals['new_leads']
@@ -448,26 +778,16 @@ def create_campaigns_tab(sh, data):
     grand_reply_pct = (grand_totals['replies'] / grand_totals['sent'] * 100) if grand_totals['sent'] > 0 else 0
     grand_opp_pct = (grand_totals['opportunities'] / grand_totals['sent'] * 100) if grand_totals['sent'] > 0 else 0
     
-    rows.append([
+    append([
         'GRAND TOTAL (YTD)', '',
-        f"{grand_totals['sent']:,}", f"{grand_totals['new_leads']:,}", f"{grand_totals['replies']:,}", f"{grand_totals['opportunities']:,}",
-        f"{grand_reply_pct:.1f}%", f"{grand_opp_pct:.1f}%"
+        fmt_int(grand_totals['sent']), fmt_int(grand_totals['new_leads']), fmt_int(grand_totals['replies']), fmt_int(grand_totals['opportunities']),
+        fmt_pct(grand_reply_pct), fmt_pct(grand_opp_pct)
     ])
     
-    # Delete and recreate
-    try:
-        ws = sh.worksheet(tab_name)
-        sh.del_worksheet(ws)
-    except:
-        pass
-    
-    ws = sh.add_worksheet(title=tab_name, rows=500, cols=10)
-    ws.update(values=rows, range_name='A1')
-    
     # Formatting
-    print("  → Applying formatting...")
+    print("  → Building formatting requests...")
     requests = []
-    
+
     # Freeze Header Row
     requests.append({
         'updateSheetProperties': {
@@ -489,49 +809,33 @@ def create_campaigns_tab(sh, data):
     requests.append({
         'repeatCell': {
             'range': {'sheetId': ws.id, 'startRowIndex': 0, 'endRowIndex': 1, 'startColumnIndex': 0, 'endColumnIndex': 8},
-            'cell': {
-                'userEnteredFormat': {
-                    'backgroundColor': COLORS['header_dark'],
-                    'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold']},
-                    'horizontalAlignment': 'CENTER'
-                }
-            },
-            'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
+            'cell': FMT_TAB_HEADER,
+            'fields': _FMT_FIELDS
         }
     })
-    
+
     for i, row in enumerate(rows[1:], start=1):
         if row[0] and 'WEEKLY TOTAL' not in row[0] and 'GRAND TOTAL' not in row[0]:  # Week header (Col A)
-            requests.append({
-                'repeatCell': {
-                    'range': {'sheetId': ws.id, 'startRowIndex': i, 'endRowIndex': i + 1, 'startColumnIndex': 0, 'endColumnIndex': 8},
-                    'cell': {'userEnteredFormat': {'backgroundColor': COLORS['week_header_gold'], 'textFormat': {'bold': True}, 'horizontalAlignment': 'LEFT'}},
-                    'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
-                }
-            })
-        elif 'WEEKLY TOTAL' in row[0]: 
-            # Changed Alignment from CENTER to LEFT
-            requests.append({
-                'repeatCell': {
-                    'range': {'sheetId': ws.id, 'startRowIndex': i, 'endRowIndex': i + 1, 'startColumnIndex': 0, 'endColumnIndex': 8},
-                    'cell': {'userEnteredFormat': {'backgroundColor': COLORS['total_gold'], 'textFormat': {'bold': True}, 'horizontalAlignment': 'LEFT'}}, 
-                    'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
-                }
-            })
+            cell = FMT_WEEK_HEADER
+        elif 'WEEKLY TOTAL' in row[0]:
+            # Alignment is LEFT (changed from CENTER), as for grand total
+            cell = FMT_WEEKLY_TOTAL
         elif 'GRAND TOTAL' in row[0]:
-            # Changed Alignment from CENTER to LEFT
-            requests.append({
-                'repeatCell': {
-                    'range': {'sheetId': ws.id, 'startRowIndex': i, 'endRowIndex': i + 1, 'startColumnIndex': 0, 'endColumnIndex': 8},
-                    'cell': {'userEnteredFormat': {'backgroundColor': COLORS['grand_total_black'], 'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold']}, 'horizontalAlignment': 'LEFT'}},
-                    'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
-                }
-            })
-            
-    sh.batch_update({'requests': requests})
-    print(f"  ✓ {tab_name} created")
+            cell = FMT_GRAND_TOTAL
+        else:
+            continue
+        requests.append({
+            'repeatCell': {
+                'range': {'sheetId': ws.id, 'startRowIndex': i, 'endRowIndex': i + 1, 'startColumnIndex': 0, 'endColumnIndex': 8},
+                'cell': cell,
+                'fields': _FMT_FIELDS
+            }
+        })
 
-def create_agents_tab(sh, data):
+    print(f"  ✓ {tab_name} prepared")
+    return rows, requests
+
+def create_agents_tab(ws, data):
     """Create Agents Tab (All Time)"""
     tab_name = "Agents"
     print(f"\n👥 Creating {tab_name}...")
@@ -574,65 +878,58 @@ def create_agents_tab(sh, data):
         
         rows.append([
             email,
-            f"{stats['total_sent']:,}",
+            fmt_int(stats['total_sent']),
             str(stats['active_days']),
             f"{avg_per_day:.0f}",
             status
         ])
         
-    rows.append([f'TOTAL ({len(agent_data)} agents)', f"{total_sent:,}", '-', '-', f'{active_count} Active'])
-    
-    # Delete and recreate
-    try:
-        ws = sh.worksheet(tab_name)
-        sh.del_worksheet(ws)
-    except:
-        pass
-    try:
-        ws_old = sh.worksheet("Agents 2026")
-        sh.del_worksheet(ws_old)
-    except:
-        pass
-
-    ws = sh.add_worksheet(title=tab_name, rows=200, cols=10)
-    ws.update(values=rows, range_name='A1')
+    rows.append([f'TOTAL ({len(agent_data)} agents)', fmt_int(total_sent), '-', '-', f'{active_count} Active'])
     
     # Formatting
-    print("  → Applying formatting...")
+    print("  → Building formatting requests...")
     total_row_num = len(rows)
     requests = []
     
-    # Header
+    # Header text (background comes from the banded range below)
     requests.append({
         'repeatCell': {
             'range': {'sheetId': ws.id, 'startRowIndex': 0, 'endRowIndex': 1, 'startColumnIndex': 0, 'endColumnIndex': 5},
-            'cell': {'userEnteredFormat': {'backgroundColor': COLORS['header_dark'], 'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold']}, 'horizontalAlignment': 'CENTER'}},
-            'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
+            'cell': {'userEnteredFormat': {'textFormat': {'bold': True, 'foregroundColor': COLORS['header_text_gold']}, 'horizontalAlignment': 'CENTER'}},
+            'fields': 'userEnteredFormat(textFormat,horizontalAlignment)'
         }
     })
     
-    # Alternating rows
-    for i in range(1, total_row_num - 1):
-        bg = COLORS['row_alt_gray'] if i % 2 == 0 else COLORS['bg_white']
-        requests.append({
-            'repeatCell': {
-                'range': {'sheetId': ws.id, 'startRowIndex': i, 'endRowIndex': i + 1, 'startColumnIndex': 0, 'endColumnIndex': 5},
-                'cell': {'userEnteredFormat': {'backgroundColor': bg}},
-                'fields': 'userEnteredFormat(backgroundColor)'
+    # All backgrounds come from one native banded range: header row dark,
+    # data rows alternating white/gray, footer (total) row gold. The
+    # pattern lives server-side as a single declarative subrequest instead
+    # of any per-row repeatCell work.
+    requests.append({
+        'addBanding': {
+            'bandedRange': {
+                'range': {'sheetId': ws.id, 'startRowIndex': 0, 'endRowIndex': total_row_num, 'startColumnIndex': 0, 'endColumnIndex': 5},
+                'rowProperties': {
+                    'headerColor': COLORS['header_dark'],
+                    'firstBandColor': COLORS['bg_white'],
+                    'secondBandColor': COLORS['row_alt_gray'],
+                    'footerColor': COLORS['total_gold']
+                }
             }
-        })
-        
-    # Total Row
+        }
+    })
+
+
+    # Total Row text (background comes from the banded range's footerColor)
     requests.append({
         'repeatCell': {
             'range': {'sheetId': ws.id, 'startRowIndex': total_row_num - 1, 'endRowIndex': total_row_num, 'startColumnIndex': 0, 'endColumnIndex': 5},
-            'cell': {'userEnteredFormat': {'backgroundColor': COLORS['total_gold'], 'textFormat': {'bold': True, 'foregroundColor': COLORS['text_black']}, 'horizontalAlignment': 'CENTER'}},
-            'fields': 'userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)'
+            'cell': {'userEnteredFormat': {'textFormat': {'bold': True, 'foregroundColor': COLORS['text_black']}, 'horizontalAlignment': 'CENTER'}},
+            'fields': 'userEnteredFormat(textFormat,horizontalAlignment)'
         }
     })
-    
-    sh.batch_update({'requests': requests})
-    print(f"  ✓ {tab_name} created")
+
+    print(f"  ✓ {tab_name} prepared")
+    return rows, requests
 
 def main():
     print("=" * 80)
@@ -659,153 +956,114 @@ def main():
     # Fetch Data
     data = fetch_all_data(client)
     
-    # Create Tabs
-    create_master_dashboard(sh, data)
-    create_campaigns_tab(sh, data)
-    create_agents_tab(sh, data)
-    
-    # Re-order
-    try:
-        w1 = sh.worksheet("Master Dashboard")
-        w2 = sh.worksheet("Campaigns 2026")
-        w3 = sh.worksheet("Agents")
-        sh.reorder_worksheets([w1, w2, w3])
-        print("  ✓ Tabs reordered")
-    except Exception as e:
-        print(f"  ⚠️ Could not reorder tabs: {e}")
-    
+    # Recreate all tabs in one batchUpdate; indexes are set at creation so
+    # no separate reorder call is needed
+    print("\n📑 Rebuilding worksheets (single batch)...")
+    worksheets = rebuild_worksheets(sh, [
+        ("Master Dashboard", 100, 10),
+        ("Campaigns 2026", 500, 10),
+        ("Agents", 200, 10),
+    ])
+    print(f"  ✓ Created tabs: {list(worksheets.keys())}")
+
+    # Build all three tabs in memory. Cell values for every tab go out in
+    # one values batchUpdate and all formatting requests (merges, cell
+    # styles, sheet properties) in one batch_update - two round trips and
+    # two quota units total instead of one write + one format per tab
+    format_requests = []
+    value_ranges = []
+    for title, builder in (("Master Dashboard", create_master_dashboard),
+                           ("Campaigns 2026", create_campaigns_tab),
+                           ("Agents", create_agents_tab)):
+        rows, requests = builder(worksheets[title], data)
+        value_ranges.append({'range': f"'{title}'!A1", 'values': rows})
+        format_requests += requests
+
+    print("\n📤 Writing cell values (single batch)...")
+    sh.values_batch_update(body={
+        'valueInputOption': 'RAW',
+        'data': value_ranges,
+    })
+    print("  ✓ Values written")
+
+    print("\n🎨 Applying formatting (single batch)...")
+    sh.batch_update({'requests': format_requests})
+    print("  ✓ Formatting applied")
+
     print("\n✅ COMPLETE!")
     
     # --- Email Logic ---
     recipients_str = os.getenv("CONNECT_RESOURCES_REPORT_RECIPIENTS", "Jose@Luxvance.com")
     recipients = [r.strip() for r in recipients_str.split(",") if r.strip()]
     
-    if recipients:
-        # Calculate Date Range (Current Week)
-        today = datetime.date.today()
-        week_start = today - datetime.timedelta(days=today.weekday())
-        week_end = week_start + datetime.timedelta(days=6)
-        
-        # Get ISO week number
-        iso_year, iso_week, _ = week_start.isocalendar()
-        
-        # Metrics
-        week_sent = 0
-        week_replies = 0
-        week_opps = 0
-        
-        all_time_sent = 0
-        all_time_replies = 0
-        all_time_opps = 0
-        
-        for c_id, days in data['campaign_analytics'].items():
-            for day in days:
-                d = datetime.datetime.strptime(day['date'], '%Y-%m-%d').date()
-                
-                # All-Time 
-                all_time_sent += day.get('sent', 0)
-                all_time_replies += day.get('unique_replies', 0)
-                all_time_opps += day.get('opportunities', 0)
-                
-                # Current Week
-                if week_start <= d <= week_end:
-                    week_sent += day.get('sent', 0)
-                    week_replies += day.get('unique_replies', 0)
-                    week_opps += day.get('opportunities', 0)
-        
-        # Rates
-        week_reply_rate = f"{(week_replies / week_sent * 100):.1f}%" if week_sent > 0 else "0.0%"
-        week_opp_rate = f"{(week_opps / week_sent * 100):.1f}%" if week_sent > 0 else "0.0%"
-        
-        all_time_reply_rate = f"{(all_time_replies / all_time_sent * 100):.1f}%" if all_time_sent > 0 else "0.0%"
-        all_time_opp_rate = f"{(all_time_opps / all_time_sent * 100):.1f}%" if all_time_sent > 0 else "0.0%"
-        
-        # Format Dates
-        def suffix(d):
-            return 'th' if 11<=d<=13 else {1:'st',2:'nd',3:'rd'}.get(d%10, 'th')
-        
-        start_fmt = f"{week_start.strftime('%A')} {week_start.day}{suffix(week_start.day)} of {week_start.strftime('%B')}"
-        end_fmt = f"{week_end.strftime('%A')} {week_end.day}{suffix(week_end.day)} of {week_end.strftime('%B')} {week_end.year}"
-        
-        # HTML Content
-        html_content = f"""
-        <div style="font-family: Arial, sans-serif; color: #333; max-width: 600px; margin: 0 auto; border: 1px solid #e0e0e0; border-radius: 8px; overflow: hidden;">
-            <!-- Header -->
-            <div style="background-color: #000000; padding: 20px; text-align: center;">
-                <h2 style="color: #D4AF37; margin: 0; font-size: 24px;">Connect Resources Report - Week {iso_week}</h2>
-                <div style="margin-top: 8px;">
-                    <span style="color: #FFFFFF; font-size: 14px; background-color: #222; padding: 4px 12px; border-radius: 4px;">{start_fmt} to {end_fmt}</span>
-                </div>
-            </div>
-            
-            <!-- Weekly Metrics -->
-            <div style="padding: 25px 20px 15px 20px;">
-                <div style="text-align: center; margin-bottom: 20px;">
-                    <h3 style="margin: 0; color: #000; font-size: 16px; text-transform: uppercase;">Weekly Performance</h3>
-                </div>
-                <table style="width: 100%; text-align: center; border-collapse: collapse;">
-                    <tr>
-                        <td style="padding: 10px; width: 33%;">
-                            <div style="font-size: 28px; font-weight: bold; color: #000000;">{week_sent:,}</div>
-                            <div style="font-size: 11px; color: #666; text-transform: uppercase; letter-spacing: 1px;">Emails Sent</div>
-                        </td>
-                        <td style="padding: 10px; border-left: 1px solid #eee; border-right: 1px solid #eee; width: 33%;">
-                            <div style="font-size: 28px; font-weight: bold; color: #D4AF37;">{week_replies:,}</div>
-                            <div style="font-size: 11px; color: #666; text-transform: uppercase; letter-spacing: 1px;">Replies</div>
-                            <div style="font-size: 11px; color: #D4AF37; margin-top: 4px; font-weight: bold;">Rate: {week_reply_rate}</div>
-                        </td>
-                        <td style="padding: 10px; width: 33%;">
-                            <div style="font-size: 28px; font-weight: bold; color: #000000;">{week_opps:,}</div>
-                            <div style="font-size: 11px; color: #666; text-transform: uppercase; letter-spacing: 1px;">Opportunities</div>
-                            <div style="font-size: 11px; color: #000; margin-top: 4px; font-weight: bold;">Rate: {week_opp_rate}</div>
-                        </td>
-                    </tr>
-                </table>
-            </div>
-            
-            <!-- Divider -->
-            <div style="height: 1px; background: linear-gradient(to right, #fff, #D4AF37, #fff); margin: 0 20px;"></div>
-            
-            <!-- All-Time Metrics -->
-            <div style="padding: 20px 20px 30px 20px; background-color: #FAFAFA;">
-                <div style="text-align: center; margin-bottom: 20px;">
-                    <h3 style="margin: 0; color: #666; font-size: 14px; text-transform: uppercase;">All-Time Performance</h3>
-                </div>
-                <table style="width: 100%; text-align: center; border-collapse: collapse;">
-                    <tr>
-                        <td style="padding: 10px; width: 33%;">
-                            <div style="font-size: 22px; font-weight: bold; color: #444;">{all_time_sent:,}</div>
-                            <div style="font-size: 10px; color: #888; text-transform: uppercase; letter-spacing: 1px;">Total Sent</div>
-                        </td>
-                        <td style="padding: 10px; border-left: 1px solid #e0e0e0; border-right: 1px solid #e0e0e0; width: 33%;">
-                            <div style="font-size: 22px; font-weight: bold; color: #BFAE58;">{all_time_replies:,}</div>
-                            <div style="font-size: 10px; color: #888; text-transform: uppercase; letter-spacing: 1px;">Total Replies</div>
-                            <div style="font-size: 10px; color: #BFAE58; margin-top: 2px;">Rate: {all_time_reply_rate}</div>
-                        </td>
-                        <td style="padding: 10px; width: 33%;">
-                            <div style="font-size: 22px; font-weight: bold; color: #444;">{all_time_opps:,}</div>
-                            <div style="font-size: 10px; color: #888; text-transform: uppercase; letter-spacing: 1px;">Total Opps</div>
-                            <div style="font-size: 10px; color: #444; margin-top: 2px;">Rate: {all_time_opp_rate}</div>
-                        </td>
-                    </tr>
-                </table>
-                
-                <div style="margin-top: 35px; text-align: center;">
-                    <a href="https://docs.google.com/spreadsheets/d/{SHEET_ID}" style="background-color: #000000; color: #D4AF37; padding: 12px 30px; text-decoration: none; border-radius: 4px; font-weight: bold; display: inline-block; border: 1px solid #D4AF37; font-size: 14px;">
-                        View Master Dashboard
-                    </a>
-                </div>
-            </div>
-        </div>
-        """
-        
-        send_email_report(
-            subject=f"Connect Resources Report - Week {iso_week} ({week_start.strftime('%b %d')} to {week_end.strftime('%b %d')})",
-            html_content=html_content,
-            recipients=recipients
-        )
-    else:
+    if not recipients:
         print("  ⚠️  No recipients found")
+        return
+
+    # Date range and metrics come straight from compute_aggregates -
+    # no re-walk of the daily table here
+    aggregates = data['aggregates']
+    week_start = aggregates['week_start']
+    week_end = aggregates['week_end']
+
+    # Get ISO week number
+    iso_year, iso_week, _ = week_start.isocalendar()
+
+    # Metrics
+    week_sent = aggregates['this_week']['sent']
+    week_replies = aggregates['this_week']['replies']
+    week_opps = aggregates['this_week']['opportunities']
+
+    all_time_sent = aggregates['all_time']['sent']
+    all_time_replies = aggregates['all_time']['replies']
+    all_time_opps = aggregates['all_time']['opportunities']
+
+
+    # Rates
+    week_reply_rate = f"{(week_replies / week_sent * 100):.1f}%" if week_sent > 0 else "0.0%"
+    week_opp_rate = f"{(week_opps / week_sent * 100):.1f}%" if week_sent > 0 else "0.0%"
+    
+    all_time_reply_rate = f"{(all_time_replies / all_time_sent * 100):.1f}%" if all_time_sent > 0 else "0.0%"
+    all_time_opp_rate = f"{(all_time_opps / all_time_sent * 100):.1f}%" if all_time_sent > 0 else "0.0%"
+    
+    # Format Dates
+    start_fmt = f"{week_start.strftime('%A')} {week_start.day}{suffix(week_start.day)} of {week_start.strftime('%B')}"
+    end_fmt = f"{week_end.strftime('%A')} {week_end.day}{suffix(week_end.day)} of {week_end.strftime('%B')} {week_end.year}"
+    
+    # Thousand-separate all six metric values in one tight pass; the
+    # template then substitutes plain strings with no filter calls
+    (week_sent_s, week_replies_s, week_opps_s,
+     all_sent_s, all_replies_s, all_opps_s) = [
+        format(v, ',d') for v in (week_sent, week_replies, week_opps,
+                                  all_time_sent, all_time_replies, all_time_opps)
+    ]
+
+    # HTML Content (precompiled template, see _REPORT_TMPL)
+    html_content = _REPORT_TMPL.render(
+        iso_week=iso_week,
+        start_fmt=start_fmt,
+        end_fmt=end_fmt,
+        week_sent=week_sent_s,
+        week_replies=week_replies_s,
+        week_opps=week_opps_s,
+        week_reply_rate=week_reply_rate,
+        week_opp_rate=week_opp_rate,
+        all_time_sent=all_sent_s,
+        all_time_replies=all_replies_s,
+        all_time_opps=all_opps_s,
+        all_time_reply_rate=all_time_reply_rate,
+        all_time_opp_rate=all_time_opp_rate,
+    )
+
+    # Subject pieces computed once; iso_week, ws and we are the only
+    # per-run variables in the subject line
+    ws = week_start.strftime('%b %d')
+    we = week_end.strftime('%b %d')
+    send_email_report(
+        subject=f"Connect Resources Report - Week {iso_week} ({ws} to {we})",
+        html_content=html_content,
+        recipients=recipients
+    )
 
 if __name__ == "__main__":
     main()